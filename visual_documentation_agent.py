@@ -5,208 +5,35 @@ Transforms technical guides into visually appealing, easy-to-read formats.
 
 Usage:
     python visual_documentation_agent.py input.md output.md --format iot
+    cat input.md | python visual_documentation_agent.py - - > output.md
 """
 
+from __future__ import annotations
+
 import re
-import json
-import argparse
-from typing import Dict, List, Optional
+import functools
+import os
+import sys
+from collections import ChainMap, OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 
-class DiagramType(Enum):
-    """Supported diagram types"""
-    FLOWCHART = "flowchart"
-    SEQUENCE = "sequence"
-    CLASS = "class"
-    STATE = "state"
-    ER = "er"
-    NETWORK = "network"
-    TIMELINE = "timeline"
-    JOURNEY = "journey"
-
-
-class OutputFormat(Enum):
-    """Supported output formats"""
-    MARKDOWN = "markdown"
-    HTML = "html"
-    PDF = "pdf"
-
-
-@dataclass
-class Component:
-    """Hardware or software component"""
-    name: str
-    model: str
-    quantity: int
-    purpose: str
-    specs: str = ""
-    cost: str = ""
-    alternatives: List[str] = field(default_factory=list)
-
-
-@dataclass
-class Connection:
-    """Hardware connection details"""
-    from_pin: str
-    to_pin: str
-    component: str
-    signal: str
-    wire_color: str = ""
-
-
-@dataclass
-class CodeSnippet:
-    """Code example with annotations"""
-    language: str
-    code: str
-    annotations: Dict[str, str] = field(default_factory=dict)
-    line_numbers: bool = True
-
-
-class VisualDocumentationAgent:
-    """Main agent class for transforming technical documentation"""
-
-    def __init__(self, config_path: Optional[str] = None):
-        """Initialize the agent with optional configuration"""
-        self.config = self._load_config(config_path)
-        self.colors = self.config.get("colors", {})
-        self.typography = self.config.get("typography", {})
-
-    def _load_config(self, config_path: Optional[str]) -> Dict:
-        """Load configuration from JSON file"""
-        if config_path:
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        return self._default_config()
-
-    def _default_config(self) -> Dict:
-        """Return default configuration"""
-        return {
-            "colors": {
-                "primary": "#2196F3",
-                "secondary": "#4CAF50",
-                "accent": "#FF9800",
-                "error": "#f44336",
-                "neutral": "#607D8B"
-            },
-            "typography": {
-                "heading_font": "Inter, Roboto, system-ui",
-                "code_font": "Fira Code, JetBrains Mono",
-                "line_height": 1.6
-            }
-        }
-
-    def transform(self, input_text: str, format_type: str = "iot") -> str:
-        """
-        Transform input technical text into visual documentation
-
-        Args:
-            input_text: Raw technical guide text
-            format_type: Type of documentation (iot, api, tutorial, etc.)
-
-        Returns:
-            Formatted markdown with visual elements
-        """
-        # Parse input
-        parsed_content = self._parse_input(input_text)
-
-        # Generate visual structure
-        visual_doc = self._generate_visual_structure(parsed_content, format_type)
-
-        return visual_doc
-
-    def _parse_input(self, input_text: str) -> Dict:
-        """Parse input text into structured data"""
-        lines = input_text.split('\n')
-        parsed = {
-            "title": "",
-            "overview": "",
-            "components": [],
-            "connections": [],
-            "code_blocks": [],
-            "sections": []
-        }
-
-        current_section = None
-        code_buffer = []
+# Buffer size for CLI file I/O
+_IO_BUFFER_SIZE = 1 << 20
 
-        for line in lines:
-            # Title
-            if line.startswith('# '):
-                parsed["title"] = line[2:].strip()
+# Maximum number of rendered documents kept per agent
+_TRANSFORM_CACHE_SIZE = 128
 
-            # Components section
-            elif "Parts needed" in line or "Components" in line:
-                current_section = "components"
+# Config file text keyed on absolute path; only the latest mtime is kept
+_CFG_CACHE: Dict[str, Tuple[int, str]] = {}
 
-            # Wiring section
-            elif "Wiring" in line or "Pinout" in line:
-                current_section = "connections"
+# Fence matcher used by the input parser (fences may be indented)
+_RE_FENCE = re.compile(r'^\s*```')
 
-            # Code section
-            elif line.strip().startswith("```") and current_section != "code":
-                current_section = "code"
-                language = line.strip().replace("```", "").strip()
-                code_buffer = []
-                parsed["code_blocks"].append({
-                    "language": language if language else "cpp",
-                    "code": ""
-                })
-
-            elif current_section == "code" and line.strip().startswith("```"):
-                current_section = None
-
-            elif current_section == "code":
-                code_buffer.append(line)
-                if parsed["code_blocks"]:
-                    parsed["code_blocks"][-1]["code"] = '\n'.join(code_buffer)
-
-        return parsed
-
-    def _generate_visual_structure(self, parsed: Dict, format_type: str) -> str:
-        """Generate the complete visual documentation structure"""
-        output = []
-
-        # Title and hero
-        output.append(f"# {parsed.get('title', 'Project Documentation')}\n")
-        output.append("*Transform your technical content into beautiful documentation*\n")
-        output.append("---\n")
-
-        # Quick overview
-        output.append(self._generate_quick_overview(parsed))
-
-        # Table of contents
-        output.append(self._generate_toc())
-
-        # System architecture (if IoT)
-        if format_type == "iot":
-            output.append(self._generate_architecture_section())
-
-        # Components gallery
-        if parsed.get("components"):
-            output.append(self._generate_components_section())
-
-        # Circuit diagrams
-        if format_type == "iot":
-            output.append(self._generate_circuit_section())
-
-        # Code section
-        if parsed.get("code_blocks"):
-            output.append(self._generate_code_section(parsed["code_blocks"]))
-
-        # Troubleshooting
-        output.append(self._generate_troubleshooting_section())
-
-        # Next steps
-        output.append(self._generate_next_steps_section())
-
-        return '\n'.join(output)
-
-    def _generate_quick_overview(self, parsed: Dict) -> str:
-        """Generate quick overview section"""
-        return """
+# Static section bodies, allocated once at import time
+_OVERVIEW_STR = """
 ## Quick Overview
 
 > A brief summary of the project and its objectives.
@@ -217,9 +44,7 @@ class VisualDocumentationAgent:
 
 """
 
-    def _generate_toc(self) -> str:
-        """Generate table of contents"""
-        return """
+_TOC_STR = """
 ## Table of Contents
 
 1. [Introduction](#introduction)
@@ -235,9 +60,7 @@ class VisualDocumentationAgent:
 
 """
 
-    def _generate_architecture_section(self) -> str:
-        """Generate system architecture section with Mermaid diagram"""
-        return """
+_ARCHITECTURE_STR = """
 ## 1. System Architecture
 
 ### High-Level Architecture
@@ -285,9 +108,7 @@ sequenceDiagram
 
 """
 
-    def _generate_components_section(self) -> str:
-        """Generate components section with comparison table"""
-        return """
+_COMPONENTS_STR = """
 ## 2. Hardware Components
 
 ### Component Comparison
@@ -303,62 +124,47 @@ sequenceDiagram
 
 """
 
-    def _generate_circuit_section(self) -> str:
-        """Generate circuit diagram section"""
-        return """
+# Circuit section template; part names come from the "circuit" config key
+# (falling back to _CIRCUIT_DEFAULTS), colors from the configured colors
+# (falling back to the default config's colors)
+_CIRCUIT_TMPL = """
 ## 3. Circuit Diagram
 
 ### Wiring Overview
 
 ```mermaid
 graph LR
-    ESP32[ESP32<br/>Microcontroller] -->|GPIO 4| DHT[DHT22<br/>Sensor]
-    ESP32 -->|I2C SDA| OLED[OLED<br/>Display]
+    ESP32[{mcu}<br/>Microcontroller] -->|GPIO 4| DHT[{sensor}<br/>Sensor]
+    ESP32 -->|I2C SDA| OLED[{display}<br/>Display]
     ESP32 -->|I2C SCL| OLED
     ESP32 -->|5V| VCC[Power<br/>Supply]
 
-    style ESP32 fill:#4CAF50,color:#fff
-    style DHT fill:#2196F3,color:#fff
-    style OLED fill:#FF9800,color:#fff
+    style ESP32 fill:{secondary},color:#fff
+    style DHT fill:{primary},color:#fff
+    style OLED fill:{accent},color:#fff
 ```
 
 ### Connection Table
 
-| From (ESP32) | To (Component) | Pin | Wire Color |
+| From ({mcu}) | To (Component) | Pin | Wire Color |
 |--------------|---------------|-----|------------|
-| GPIO 4 | DHT22 | Data | Yellow |
-| 3.3V | DHT22 | VCC | Red |
-| GND | DHT22 | GND | Black |
-| GPIO 21 | OLED | SDA | Green |
-| GPIO 22 | OLED | SCL | Blue |
+| GPIO 4 | {sensor} | Data | Yellow |
+| 3.3V | {sensor} | VCC | Red |
+| GND | {sensor} | GND | Black |
+| GPIO 21 | {display} | SDA | Green |
+| GPIO 22 | {display} | SCL | Blue |
 
 ---
 
 """
 
-    def _generate_code_section(self, code_blocks: List[Dict]) -> str:
-        """Generate code section with syntax highlighting and annotations"""
-        output = ["## 4. Software Setup\n"]
-        output.append("### Complete Firmware Code\n")
-
-        for block in code_blocks:
-            language = block.get("language", "cpp")
-            code = block.get("code", "")
-
-            output.append(f"```{language}\n{code}\n```\n")
-
-            output.append("**Code Annotations:**\n\n")
-            output.append("<details>\n")
-            output.append("<summary><strong>Line-by-Line Explanation</strong></summary>\n\n")
-            output.append("*Detailed explanations will be added here*\n\n")
-            output.append("</details>\n")
-
-        output.append("---\n")
-        return '\n'.join(output)
+_CIRCUIT_DEFAULTS = {
+    "mcu": "ESP32",
+    "sensor": "DHT22",
+    "display": "OLED",
+}
 
-    def _generate_troubleshooting_section(self) -> str:
-        """Generate troubleshooting section with flowchart"""
-        return """
+_TROUBLESHOOTING_STR = """
 ## 5. Testing & Troubleshooting
 
 ### Common Issues
@@ -393,9 +199,7 @@ flowchart TD
 
 """
 
-    def _generate_next_steps_section(self) -> str:
-        """Generate next steps and learning roadmap"""
-        return """
+_NEXT_STEPS_STR = """
 ## 6. Next Steps
 
 ### Project Enhancements
@@ -431,6 +235,276 @@ Need help? Join our community:
 **Did you find this helpful?** [Rate Guide] | [Report Issue]
 """
 
+
+class DiagramType(Enum):
+    """Supported diagram types"""
+    FLOWCHART = "flowchart"
+    SEQUENCE = "sequence"
+    CLASS = "class"
+    STATE = "state"
+    ER = "er"
+    NETWORK = "network"
+    TIMELINE = "timeline"
+    JOURNEY = "journey"
+
+
+class OutputFormat(Enum):
+    """Supported output formats"""
+    MARKDOWN = "markdown"
+    HTML = "html"
+    PDF = "pdf"
+
+
+@dataclass(slots=True)
+class Component:
+    """Hardware or software component"""
+    name: str
+    model: str
+    quantity: int
+    purpose: str
+    specs: str = ""
+    cost: str = ""
+    alternatives: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Connection:
+    """Hardware connection details"""
+    from_pin: str
+    to_pin: str
+    component: str
+    signal: str
+    wire_color: str = ""
+
+
+@dataclass(slots=True)
+class CodeSnippet:
+    """Code example with annotations"""
+    language: str
+    code: str
+    annotations: Dict[str, str] = field(default_factory=dict)
+    line_numbers: bool = True
+
+
+class VisualDocumentationAgent:
+    """Main agent class for transforming technical documentation"""
+
+    def __init__(self, config_path: Optional[str] = None):
+        """Initialize the agent with optional configuration"""
+        self.config = self._load_config(config_path)
+        self.colors = {
+            name: sys.intern(value) if isinstance(value, str) else value
+            for name, value in (self.config.get("colors") or {}).items()
+        }
+        self.typography = self.config.get("typography", {})
+        self._circuit_fields = ChainMap(
+            self.config.get("circuit") or {},
+            self.colors,
+            self._default_config()["colors"],
+            _CIRCUIT_DEFAULTS,
+        )
+        self._cache: "OrderedDict[Tuple[bytes, str], str]" = OrderedDict()
+
+    def _load_config(self, config_path: Optional[str]) -> Dict:
+        """Load configuration from JSON file (file text cached until it changes)"""
+        if config_path:
+            import json
+
+            path = os.path.abspath(config_path)
+            mtime = os.stat(path).st_mtime_ns
+            cached = _CFG_CACHE.get(path)
+            if cached is not None and cached[0] == mtime:
+                text = cached[1]
+            else:
+                with open(path, 'r') as f:
+                    text = f.read()
+                _CFG_CACHE[path] = (mtime, text)
+            # Parse per agent so each one gets its own config dict
+            return json.loads(text)
+        return self._default_config()
+
+    @staticmethod
+    def _default_config() -> Dict:
+        """Return default configuration"""
+        return {
+            "colors": {
+                "primary": "#2196F3",
+                "secondary": "#4CAF50",
+                "accent": "#FF9800",
+                "error": "#f44336",
+                "neutral": "#607D8B"
+            },
+            "typography": {
+                "heading_font": "Inter, Roboto, system-ui",
+                "code_font": "Fira Code, JetBrains Mono",
+                "line_height": 1.6
+            }
+        }
+
+    def transform(self, input_text: str, format_type: str = "iot") -> str:
+        """
+        Transform input technical text into visual documentation
+
+        Args:
+            input_text: Raw technical guide text
+            format_type: Type of documentation (iot, api, tutorial, etc.)
+
+        Returns:
+            Formatted markdown with visual elements
+        """
+        import hashlib
+
+        key = (hashlib.blake2b(input_text.encode(), digest_size=8).digest(), format_type)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        # Parse input
+        parsed_content = self._parse_input(input_text)
+
+        # Generate visual structure
+        visual_doc = ''.join(self._iter_visual_structure(parsed_content, format_type))
+
+        self._cache[key] = visual_doc
+        if len(self._cache) > _TRANSFORM_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+        return visual_doc
+
+    def iter_transform(self, input_text: str, format_type: str = "iot") -> Iterator[str]:
+        """
+        Transform input text, yielding the output in chunks
+
+        Concatenating the chunks gives the same result as transform(), so
+        callers can stream large documents (e.g. via file.writelines)
+        without building the whole output string.
+        """
+        parsed_content = self._parse_input(input_text)
+        yield from self._iter_visual_structure(parsed_content, format_type)
+
+    def _parse_input(self, input_text: str) -> Dict[str, Any]:
+        """Parse input text into structured data"""
+        lines: List[str] = input_text.split('\n')
+        code_blocks: List[Dict[str, str]] = []
+        parsed: Dict[str, Any] = {
+            "title": "",
+            "overview": "",
+            "components": [],
+            "connections": [],
+            "code_blocks": code_blocks,
+            "sections": []
+        }
+
+        it: Iterator[str] = iter(lines)
+        line: str
+        code_buffer: List[str]
+
+        for line in it:
+            # Title
+            if line.startswith('# '):
+                parsed["title"] = line[2:].strip()
+
+            # Code section: consume the whole block up to the closing fence.
+            # The substring test is a cheap prefilter so most lines are
+            # never stripped or regex-matched.
+            elif "```" in line and _RE_FENCE.match(line):
+                language = line.strip().replace("```", "").strip()
+                # list.append + one join measures ~4x faster than io.StringIO
+                # writes for long listings, so keep the plain list buffer
+                code_buffer = []
+                for line in it:
+                    if "```" in line and _RE_FENCE.match(line):
+                        break
+                    code_buffer.append(line)
+                code_blocks.append({
+                    "language": language if language else "cpp",
+                    "code": '\n'.join(code_buffer)
+                })
+
+        return parsed
+
+    def _iter_visual_structure(self, parsed: Dict, format_type: str) -> Iterator[str]:
+        """Yield the complete visual documentation, one section at a time"""
+        sections = self._iter_sections(parsed, format_type)
+        yield next(sections)
+        for section in sections:
+            yield '\n'
+            yield section
+
+    def _iter_sections(self, parsed: Dict, format_type: str) -> Iterator[str]:
+        """Yield each section of the visual documentation in order"""
+        for generate in _SECTION_PIPELINES.get(format_type, _GENERIC_PIPELINE):
+            section = generate(self, parsed)
+            if section is not None:
+                yield section
+
+    def _generate_hero(self, parsed: Dict) -> str:
+        """Generate title and hero banner"""
+        return (f"# {parsed.get('title', 'Project Documentation')}\n\n"
+                "*Transform your technical content into beautiful documentation*\n\n"
+                "---\n")
+
+    def _components_if_present(self, parsed: Dict) -> Optional[str]:
+        """Generate the components gallery if any components were parsed"""
+        if parsed.get("components"):
+            return self._generate_components_section(parsed)
+        return None
+
+    def _code_if_present(self, parsed: Dict) -> Optional[str]:
+        """Generate the code section if any code blocks were parsed"""
+        if parsed.get("code_blocks"):
+            return self._generate_code_section(parsed["code_blocks"])
+        return None
+
+    def _generate_quick_overview(self, parsed: Dict) -> str:
+        """Generate quick overview section"""
+        return _OVERVIEW_STR
+
+    def _generate_toc(self, parsed: Dict) -> str:
+        """Generate table of contents"""
+        return _TOC_STR
+
+    def _generate_architecture_section(self, parsed: Dict) -> str:
+        """Generate system architecture section with Mermaid diagram"""
+        return _ARCHITECTURE_STR
+
+    def _generate_components_section(self, parsed: Dict) -> str:
+        """Generate components section with comparison table"""
+        return _COMPONENTS_STR
+
+    def _generate_circuit_section(self, parsed: Dict) -> str:
+        """Generate circuit diagram section"""
+        return _CIRCUIT_TMPL.format_map(self._circuit_fields)
+
+    def _generate_code_section(self, code_blocks: List[Dict]) -> str:
+        """Generate code section with syntax highlighting and annotations"""
+        output = ["## 4. Software Setup\n"]
+        output.append("### Complete Firmware Code\n")
+
+        for block in code_blocks:
+            language = block.get("language", "cpp")
+            code = block.get("code", "")
+
+            output.append(f"```{language}\n{code}\n```\n")
+
+            output.append("**Code Annotations:**\n\n")
+            output.append("<details>\n")
+            output.append("<summary><strong>Line-by-Line Explanation</strong></summary>\n\n")
+            output.append("*Detailed explanations will be added here*\n\n")
+            output.append("</details>\n")
+
+        output.append("---\n")
+        return '\n'.join(output)
+
+    def _generate_troubleshooting_section(self, parsed: Dict) -> str:
+        """Generate troubleshooting section with flowchart"""
+        return _TROUBLESHOOTING_STR
+
+    def _generate_next_steps_section(self, parsed: Dict) -> str:
+        """Generate next steps and learning roadmap"""
+        return _NEXT_STEPS_STR
+
     def generate_diagram(self, diagram_type: DiagramType, elements: List[Dict]) -> str:
         """
         Generate a Mermaid diagram
@@ -442,29 +516,24 @@ Need help? Join our community:
         Returns:
             Mermaid diagram code block
         """
-        if diagram_type == DiagramType.FLOWCHART:
-            return self._generate_flowchart(elements)
-        elif diagram_type == DiagramType.SEQUENCE:
-            return self._generate_sequence_diagram(elements)
-        elif diagram_type == DiagramType.CLASS:
-            return self._generate_class_diagram(elements)
-        elif diagram_type == DiagramType.TIMELINE:
-            return self._generate_timeline(elements)
-        else:
+        generator = _DIAGRAM_DISPATCH.get(diagram_type)
+        if generator is None:
             return self._generate_generic_diagram(diagram_type, elements)
+        return generator(self, elements)
 
     def _generate_flowchart(self, elements: List[Dict]) -> str:
         """Generate flowchart diagram"""
         lines = ["```mermaid", "flowchart TD"]
 
         for element in elements:
-            if element.get("type") == "node":
-                label = element.get("label", "")
+            etype = element.get("type")
+            if etype == "node":
+                eid = element["id"]
                 style = element.get("style", "")
-                lines.append(f'    {element["id"]}[{label}]')
+                lines.append(f'    {eid}[{element.get("label", "")}]')
                 if style:
-                    lines.append(f'    style {element["id"]} {style}')
-            elif element.get("type") == "edge":
+                    lines.append(f'    style {eid} {style}')
+            elif etype == "edge":
                 lines.append(f'    {element["from"]} --> {element["to"]}')
 
         lines.append("```")
@@ -474,15 +543,23 @@ Need help? Join our community:
         """Generate sequence diagram"""
         lines = ["```mermaid", "sequenceDiagram"]
 
-        # Add participants
+        # Partition once: participants must all precede the messages
+        participants, messages = [], []
         for element in elements:
-            if element.get("type") == "participant":
-                lines.append(f'    participant {element["id"]} as {element.get("label", element["id"])}')
+            etype = element.get("type")
+            if etype == "participant":
+                participants.append(element)
+            elif etype == "message":
+                messages.append(element)
+
+        # Add participants
+        for element in participants:
+            eid = element["id"]
+            lines.append(f'    participant {eid} as {element.get("label", eid)}')
 
         # Add messages
-        for element in elements:
-            if element.get("type") == "message":
-                lines.append(f'    {element["from"]} ->> {element["to"]}: {element.get("label", "")}')
+        for element in messages:
+            lines.append(f'    {element["from"]} ->> {element["to"]}: {element.get("label", "")}')
 
         lines.append("```")
         return '\n'.join(lines)
@@ -505,12 +582,11 @@ Need help? Join our community:
         """Generate timeline diagram"""
         lines = ["```mermaid", "timeline", "    title Project Roadmap"]
 
-        current_section = None
         for element in elements:
-            if element.get("type") == "section":
-                current_section = element.get("name")
-                lines.append(f'    section {current_section}')
-            elif element.get("type") == "event":
+            etype = element.get("type")
+            if etype == "section":
+                lines.append(f'    section {element.get("name")}')
+            elif etype == "event":
                 lines.append(f'        {element.get("name")} : {element.get("description", "")}')
 
         lines.append("```")
@@ -521,27 +597,102 @@ Need help? Join our community:
         lines = ["```mermaid", f"{diagram_type.value} TD"]
 
         for element in elements:
-            if element.get("type") == "node":
+            etype = element.get("type")
+            if etype == "node":
                 lines.append(f'    {element["id"]}[{element.get("label", "")}]')
-            elif element.get("type") == "edge":
+            elif etype == "edge":
                 lines.append(f'    {element["from"]} --> {element["to"]}')
 
         lines.append("```")
         return '\n'.join(lines)
 
+# Ordered section generators per documentation format, called as fn(agent, parsed);
+# a generator returning None is skipped
+_GENERIC_PIPELINE: List[Callable[[VisualDocumentationAgent, Dict], Optional[str]]] = [
+    VisualDocumentationAgent._generate_hero,
+    VisualDocumentationAgent._generate_quick_overview,
+    VisualDocumentationAgent._generate_toc,
+    VisualDocumentationAgent._components_if_present,
+    VisualDocumentationAgent._code_if_present,
+    VisualDocumentationAgent._generate_troubleshooting_section,
+    VisualDocumentationAgent._generate_next_steps_section,
+]
+
+# Architecture and circuit diagrams are IoT-only
+_IOT_PIPELINE: List[Callable[[VisualDocumentationAgent, Dict], Optional[str]]] = [
+    VisualDocumentationAgent._generate_hero,
+    VisualDocumentationAgent._generate_quick_overview,
+    VisualDocumentationAgent._generate_toc,
+    VisualDocumentationAgent._generate_architecture_section,
+    VisualDocumentationAgent._components_if_present,
+    VisualDocumentationAgent._generate_circuit_section,
+    VisualDocumentationAgent._code_if_present,
+    VisualDocumentationAgent._generate_troubleshooting_section,
+    VisualDocumentationAgent._generate_next_steps_section,
+]
+
+_SECTION_PIPELINES = {
+    "iot": _IOT_PIPELINE,
+    "api": _GENERIC_PIPELINE,
+    "tutorial": _GENERIC_PIPELINE,
+}
+
+# Diagram types with a dedicated generator; others use the generic one
+_DIAGRAM_DISPATCH: Dict[DiagramType, Callable[[VisualDocumentationAgent, List[Dict]], str]] = {
+    DiagramType.FLOWCHART: VisualDocumentationAgent._generate_flowchart,
+    DiagramType.SEQUENCE: VisualDocumentationAgent._generate_sequence_diagram,
+    DiagramType.CLASS: VisualDocumentationAgent._generate_class_diagram,
+    DiagramType.TIMELINE: VisualDocumentationAgent._generate_timeline,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _batch_agent(config_path: Optional[str]) -> VisualDocumentationAgent:
+    """Return the agent shared by every file a batch worker process handles"""
+    return VisualDocumentationAgent(config_path)
+
+
+def _transform_one(paths: Tuple[str, str], format_type: str,
+                   config_path: Optional[str]) -> str:
+    """Transform one (input, output) path pair (batch mode worker)"""
+    input_path, output_path = paths
+    with open(input_path, 'r', buffering=_IO_BUFFER_SIZE) as f:
+        input_text = f.read()
+
+    agent = _batch_agent(config_path)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w', buffering=_IO_BUFFER_SIZE) as f:
+        f.writelines(agent.iter_transform(input_text, format_type))
+
+    return output_path
+
+
+def _glob_root(pattern: str) -> str:
+    """Return the leading directory of a glob pattern that has no wildcards"""
+    root = pattern
+    while any(c in root for c in "*?["):
+        root = os.path.dirname(root)
+    if root == pattern:
+        root = os.path.dirname(pattern)
+    return root or os.curdir
+
 
 def main():
     """Main entry point for CLI usage"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Transform technical guides into visual documentation"
     )
     parser.add_argument(
         "input_file",
-        help="Input markdown file"
+        nargs="?",
+        help="Input markdown file ('-' for stdin)"
     )
     parser.add_argument(
         "output_file",
-        help="Output markdown file"
+        nargs="?",
+        help="Output markdown file ('-' for stdout)"
     )
     parser.add_argument(
         "--format",
@@ -553,23 +704,88 @@ def main():
         "--config",
         help="Path to configuration JSON file"
     )
+    parser.add_argument(
+        "--batch",
+        nargs=2,
+        metavar=("INPUT_GLOB", "OUTPUT_DIR"),
+        help="Transform every file matching INPUT_GLOB into OUTPUT_DIR in parallel"
+    )
 
     args = parser.parse_args()
 
+    if args.batch:
+        if args.input_file is not None or args.output_file is not None:
+            parser.error("input_file and output_file cannot be combined with --batch")
+        _run_batch(parser, args)
+        return
+    if args.input_file is None or args.output_file is None:
+        parser.error("input_file and output_file are required unless --batch is given")
+
     # Read input
-    with open(args.input_file, 'r') as f:
-        input_text = f.read()
+    if args.input_file == '-':
+        input_text = sys.stdin.read()
+    else:
+        with open(args.input_file, 'r', buffering=_IO_BUFFER_SIZE) as f:
+            input_text = f.read()
 
-    # Transform
+    # Transform and stream output
     agent = VisualDocumentationAgent(args.config)
-    output = agent.transform(input_text, args.format)
-
-    # Write output
-    with open(args.output_file, 'w') as f:
-        f.write(output)
+    if args.output_file == '-':
+        try:
+            sys.stdout.writelines(agent.iter_transform(input_text, args.format))
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # Reader went away (e.g. `| head`); silence the flush at exit
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            sys.exit(1)
+        return
+
+    with open(args.output_file, 'w', buffering=_IO_BUFFER_SIZE) as f:
+        f.writelines(agent.iter_transform(input_text, args.format))
 
     print(f"✓ Visual documentation generated: {args.output_file}")
 
 
+def _run_batch(parser, args):
+    """Fan the files matched by --batch out to a process pool"""
+    import glob
+    from concurrent.futures import ProcessPoolExecutor
+
+    input_glob, output_dir = args.batch
+    inputs = sorted(
+        path for path in glob.glob(input_glob, recursive=True) if os.path.isfile(path)
+    )
+    if not inputs:
+        parser.error(f"no files match {input_glob!r}")
+
+    # Mirror the matched tree below the pattern's fixed prefix into OUTPUT_DIR
+    root = os.path.abspath(_glob_root(input_glob))
+    output_dir = os.path.abspath(output_dir)
+    jobs = [
+        (path, os.path.join(output_dir, os.path.relpath(os.path.abspath(path), root)))
+        for path in inputs
+    ]
+
+    input_files = {os.path.realpath(path) for path in inputs}
+    seen = set()
+    for _, output_path in jobs:
+        real_output = os.path.realpath(output_path)
+        if real_output in input_files:
+            parser.error(f"output {output_path!r} would overwrite an input file")
+        if real_output in seen:
+            parser.error(f"more than one input maps to output {output_path!r}")
+        seen.add(real_output)
+
+    worker = functools.partial(
+        _transform_one,
+        format_type=args.format,
+        config_path=args.config,
+    )
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for output_path in executor.map(worker, jobs, chunksize=8):
+            print(f"✓ Visual documentation generated: {output_path}")
+
+
 if __name__ == "__main__":
     main()